@@ -12,73 +12,84 @@ Template syntax:
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+INJECT_FILE_RE = re.compile(rb'\{\{INJECT_FILE:([^}]+)\}\}')
+INJECT_RUSTDOC_RE = re.compile(rb'\{\{INJECT_RUSTDOC:([^:]+):([^}]+)\}\}')
+
+def read_normalized(path):
+    """Read a file as UTF-8 bytes with line endings normalized to LF"""
+    return path.read_bytes().replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
 def extract_rustdoc(file_path, start_pattern):
     """Extract rustdoc comment starting with a specific pattern"""
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
-    
     result = []
     in_doc_block = False
     
-    for line in lines:
-        if not in_doc_block:
-            # Look for the starting pattern
-            if line.startswith('///') and start_pattern in line:
-                in_doc_block = True
-                # Remove the /// prefix and add to result
-                result.append(line[4:] if line.startswith('/// ') else line[3:])
-        else:
-            # Continue collecting doc lines
-            if line.startswith('///'):
-                result.append(line[4:] if line.startswith('/// ') else line[3:])
+    # Stream lines so we stop reading as soon as the doc block ends
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not in_doc_block:
+                # Look for the starting pattern
+                if line.startswith('///') and start_pattern in line:
+                    in_doc_block = True
+                    # Remove the /// prefix and add to result
+                    result.append(line[4:] if line.startswith('/// ') else line[3:])
             else:
-                # End of doc block
-                break
+                # Continue collecting doc lines
+                if line.startswith('///'):
+                    result.append(line[4:] if line.startswith('/// ') else line[3:])
+                else:
+                    # End of doc block
+                    break
     
     return ''.join(result).rstrip()
 
-def process_template(template_path, output_path, project_root):
-    """Process a template file and generate output"""
-    print(f"Processing template: {template_path}")
-    print(f"Output: {output_path}")
+def process_template(template_path, output_path, project_root, log=print):
+    """Process a template file and generate output, reporting progress through `log`"""
+    log(f"Processing template: {template_path}")
+    log(f"Output: {output_path}")
     
-    with open(template_path, 'r') as f:
-        content = f.read()
+    content = read_normalized(template_path)
     
-    # Process INJECT_FILE placeholders
-    for match in re.finditer(r'\{\{INJECT_FILE:([^}]+)\}\}', content):
-        placeholder = match.group(0)
+    # Contents of injected files by relative path, None if the file could not be read
+    file_cache = {}
+    
+    def inject_file(match):
         file_path = match.group(1)
-        full_path = project_root / file_path
         
-        if full_path.exists():
-            with open(full_path, 'r') as f:
-                file_content = f.read()
-            content = content.replace(placeholder, file_content)
-        else:
-            print(f"Warning: File not found: {full_path}")
+        if file_path not in file_cache:
+            full_path = project_root / file_path.decode()
+            try:
+                file_cache[file_path] = read_normalized(full_path)
+            except OSError as e:
+                log(f"Warning: Could not read file: {full_path} ({e.strerror})")
+                file_cache[file_path] = None
+        
+        file_content = file_cache[file_path]
+        return match.group(0) if file_content is None else file_content
     
-    # Process INJECT_RUSTDOC placeholders
-    for match in re.finditer(r'\{\{INJECT_RUSTDOC:([^:]+):([^}]+)\}\}', content):
-        placeholder = match.group(0)
-        file_path = match.group(1)
-        pattern = match.group(2)
-        full_path = project_root / file_path
+    def inject_rustdoc(match):
+        full_path = project_root / match.group(1).decode()
         
-        if full_path.exists():
-            doc_content = extract_rustdoc(full_path, pattern)
-            content = content.replace(placeholder, doc_content)
-        else:
-            print(f"Warning: File not found: {full_path}")
+        try:
+            return extract_rustdoc(full_path, match.group(2).decode()).encode()
+        except OSError as e:
+            log(f"Warning: Could not read file: {full_path} ({e.strerror})")
+            return match.group(0)
+    
+    # Process INJECT_FILE placeholders
+    content = INJECT_FILE_RE.sub(inject_file, content)
+    
+    # Process INJECT_RUSTDOC placeholders
+    content = INJECT_RUSTDOC_RE.sub(inject_rustdoc, content)
     
     # Write output
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w') as f:
-        f.write(content)
+    output_path.write_bytes(content)
     
-    print(f"Generated: {output_path}")
+    log(f"Generated: {output_path}")
 
 def main():
     # Get script directory and paths
@@ -97,12 +108,21 @@ def main():
         print("No template files found in", template_dir)
         return 1
     
-    for template_path in templates:
+    def generate(template_path):
         # Get output filename (remove .template extension)
         output_filename = template_path.stem
         output_path = output_dir / output_filename
         
-        process_template(template_path, output_path, project_root)
+        messages = []
+        process_template(template_path, output_path, project_root, log=messages.append)
+        return messages
+    
+    # Templates are I/O bound, so overlap their file reads across threads, but
+    # buffer each template's messages and print them in template order
+    with ThreadPoolExecutor(max_workers=min(8, len(templates))) as executor:
+        for messages in executor.map(generate, templates):
+            for message in messages:
+                print(message)
     
     print("\nAll prompt files generated successfully!")
     return 0